@@ -3,21 +3,9 @@
 import os
 from pathlib import Path
 
-try:
-    from pypdf import PdfReader
-except ImportError:
-    print("Please install pypdf: pip install pypdf")
-    raise SystemExit(1)
+from utils.pdf_cache import read_pdf_cached
 
 
-def read_pdf(pdf_path: str | Path) -> str:
-    """Read and extract text from a PDF file."""
-    reader = PdfReader(pdf_path)
-    text_parts = []
-    for page in reader.pages:
-        text_parts.append(page.extract_text() or "")
-    return "\n".join(text_parts)
-
 #write the text to a file named output.txt in contents folder
 def write_text_to_output(text: str):
     """Write the extracted text to output.txt in the Content folder."""
@@ -44,7 +32,7 @@ def main():
         print(f"Reading: {pdf_path.name}")
         print("=" * 60)
         try:
-            text = read_pdf(pdf_path)
+            text = read_pdf_cached(pdf_path)
             #print(text)
             write_text_to_output(text)
         except Exception as e:
@@ -1,21 +1,65 @@
 """Process PDF files in Content sub-folders and write content to output.txt in each."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
+
+from utils.pdf_cache import read_pdf_cached
+
+
+def _process_subfolder(subfolder_path: str) -> tuple[str, bool, str]:
+    """Extract the PDFs in one sub-folder into its output.txt.
+
+    Runs in a worker process, so progress is collected and returned as
+    (subfolder_path, written, message) for the parent to print in order.
+    """
+    subfolder_name = os.path.basename(subfolder_path)
+    lines = [f"\nProcessing sub-folder: {subfolder_name}"]
+
+    # 2. Handle case where PDF file is not present in a sub-folder
+    with os.scandir(subfolder_path) as entries:
+        pdf_files = sorted(
+            (e for e in entries if e.is_file() and e.name.lower().endswith(".pdf")),
+            key=lambda e: e.name,
+        )
+    if not pdf_files:
+        lines.append(f"  Skipping: No PDF files found in {subfolder_name}")
+        return subfolder_path, False, "\n".join(lines)
+
+    # Extract text from all PDFs in the sub-folder. Pages are read in this
+    # process; the sub-folders themselves already run in parallel.
+    combined_text = []
+    for pdf_entry in pdf_files:
+        try:
+            text = read_pdf_cached(pdf_entry.path, max_workers=1)
+            combined_text.append(f"--- {pdf_entry.name} ---\n{text}")
+        except Exception as e:
+            lines.append(f"  Error reading {pdf_entry.name}: {e}")
+            continue
 
-try:
-    from pypdf import PdfReader
-except ImportError:
-    print("Please install pypdf: pip install pypdf")
-    raise SystemExit(1)
-
-
-def read_pdf(pdf_path: Path) -> str:
-    """Read and extract text from a PDF file."""
-    reader = PdfReader(pdf_path)
-    text_parts = []
-    for page in reader.pages:
-        text_parts.append(page.extract_text() or "")
-    return "\n".join(text_parts)
+    if not combined_text:
+        lines.append(f"  Skipping: Could not extract text from any PDF in {subfolder_name}")
+        return subfolder_path, False, "\n".join(lines)
+
+    # 3. Handle case where output.txt cannot be written
+    output_path = os.path.join(subfolder_path, "output.txt")
+    try:
+        # Write the parts through one large buffer rather than building
+        # a single joined string first.
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            for i, part in enumerate(combined_text):
+                if i:
+                    f.write(b"\n\n")
+                f.write(part.encode("utf-8"))
+        lines.append(f"  Success: Written to {output_path}")
+    except PermissionError:
+        lines.append(f"  Error: Cannot write to {output_path} (permission denied)")
+        return subfolder_path, False, "\n".join(lines)
+    except OSError as e:
+        lines.append(f"  Error: Failed to write output.txt in {subfolder_name}: {e}")
+        return subfolder_path, False, "\n".join(lines)
+
+    return subfolder_path, True, "\n".join(lines)
 
 
 def process_content_folder() -> None:
@@ -31,44 +75,27 @@ def process_content_folder() -> None:
         print(f"Error: {content_dir} is not a directory.")
         return
 
-    subfolders = [f for f in content_dir.iterdir() if f.is_dir()]
+    # os.scandir returns the entry type from the directory read itself, so
+    # no extra stat call is made per entry.
+    with os.scandir(content_dir) as entries:
+        subfolders = sorted(
+            (e for e in entries if e.is_dir(follow_symlinks=False)),
+            key=lambda e: e.name,
+        )
 
     if not subfolders:
         print("No sub-folders found under Content directory.")
         return
 
-    for subfolder in sorted(subfolders):
-        print(f"\nProcessing sub-folder: {subfolder.name}")
+    # Sub-folders are independent, so each one is handled in its own process.
+    workers = min(os.cpu_count() or 1, len(subfolders))
+    written = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for _, ok, message in executor.map(_process_subfolder, [e.path for e in subfolders]):
+            print(message)
+            written += ok
 
-        # 2. Handle case where PDF file is not present in a sub-folder
-        pdf_files = list(subfolder.glob("*.pdf"))
-        if not pdf_files:
-            print(f"  Skipping: No PDF files found in {subfolder.name}")
-            continue
-
-        # Extract text from all PDFs in the sub-folder
-        combined_text = []
-        for pdf_path in sorted(pdf_files):
-            try:
-                text = read_pdf(pdf_path)
-                combined_text.append(f"--- {pdf_path.name} ---\n{text}")
-            except Exception as e:
-                print(f"  Error reading {pdf_path.name}: {e}")
-                continue
-
-        if not combined_text:
-            print(f"  Skipping: Could not extract text from any PDF in {subfolder.name}")
-            continue
-
-        # 3. Handle case where output.txt cannot be written
-        output_path = subfolder / "output.txt"
-        try:
-            output_path.write_text("\n\n".join(combined_text), encoding="utf-8")
-            print(f"  Success: Written to {output_path}")
-        except PermissionError:
-            print(f"  Error: Cannot write to {output_path} (permission denied)")
-        except OSError as e:
-            print(f"  Error: Failed to write output.txt in {subfolder.name}: {e}")
+    print(f"\nWrote output.txt in {written} of {len(subfolders)} sub-folder(s).")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,8 @@
 
 from pathlib import Path
 
-try:
-    from pypdf import PdfReader
-except ImportError:
-    print("Please install pypdf: pip install pypdf")
-    raise SystemExit(1)
+from utils.pdf import page_count
+from utils.pdf_cache import read_page_cached
 
 
 def write_text_to_output(text: str) -> None:
@@ -56,19 +53,17 @@ def main():
     print(f"\nReading from file: {pdf_path.name}")
 
     try:
-        reader = PdfReader(pdf_path)
+        total_pages = page_count(pdf_path)
     except Exception as e:
         print(f"Error opening PDF file {pdf_path.name}: {e}")
         return
 
-    total_pages = len(reader.pages)
     if page_number > total_pages:
         print(f"Error: Page number {page_number} is out of range. PDF has only {total_pages} pages.")
         return
 
     try:
-        page = reader.pages[page_number - 1]
-        text = page.extract_text() or ""
+        text = read_page_cached(pdf_path, page_number - 1)
     except Exception as e:
         print(f"Error reading page {page_number} from {pdf_path.name}: {e}")
         return
@@ -5,11 +5,9 @@ from pathlib import Path
 import json
 import re
 
-try:
-    from pypdf import PdfReader
-except ImportError:
-    print("Please install pypdf: pip install pypdf")
-    raise SystemExit(1)
+from utils.pdf import page_count
+from utils.pdf_cache import read_page_cached
+from utils.regex import compile_pattern
 
 
 def write_text_to_output(text: str) -> None:
@@ -63,7 +61,7 @@ def main():
 
     # Compile regex and handle invalid patterns
     try:
-        pattern = re.compile(regex_pattern, re.MULTILINE)
+        pattern = compile_pattern(regex_pattern, re.MULTILINE)
     except re.error as e:
         print(f"Error: Invalid regular expression in configuration: {e}")
         return
@@ -90,19 +88,17 @@ def main():
     print(f"\nReading from file: {pdf_path.name}")
 
     try:
-        reader = PdfReader(pdf_path)
+        total_pages = page_count(pdf_path)
     except Exception as e:
         print(f"Error opening PDF file {pdf_path.name}: {e}")
         return
 
-    total_pages = len(reader.pages)
     if page_number > total_pages:
         print(f"Error: Page number {page_number} is out of range. PDF has only {total_pages} pages.")
         return
 
     try:
-        page = reader.pages[page_number - 1]
-        text = page.extract_text() or ""
+        text = read_page_cached(pdf_path, page_number - 1)
     except Exception as e:
         print(f"Error reading page {page_number} from {pdf_path.name}: {e}")
         return
@@ -110,22 +106,20 @@ def main():
     # 3. Handle case where output.txt file is not available in the folder
     # (we create it if missing, and handle write errors)
     # 3. Update code to extract only the content matching the regular expression
-    matches = pattern.findall(text)
-    if not matches:
+    formatted_matches: list[str] = []
+    for m in pattern.finditer(text):
+        groups = m.groups()
+        if groups:
+            formatted_matches.append("\n".join(part.strip() for part in groups if part))
+        else:
+            formatted_matches.append(m.group(0).strip())
+
+    if not formatted_matches:
         print("No content matched the configured regular expression.")
         write_text_to_output("")
         return
 
-    formatted_matches = []
-
-    for m in matches:
-        if isinstance(m, tuple):
-            formatted_matches.append("\n".join(part.strip() for part in m if part))
-        else:
-            formatted_matches.append(str(m).strip())
-
-    matched_text = "\n\n".join(formatted_matches)
-    write_text_to_output(matched_text)
+    write_text_to_output("\n\n".join(formatted_matches))
 
 
 if __name__ == "__main__":
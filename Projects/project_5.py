@@ -4,26 +4,27 @@ and store them in a MySQL database.
 DB connection settings are read from `Configs/config.json` under the `db` key.
 """
 
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from pathlib import Path
 import json
 import re
 
-try:
-    from pypdf import PdfReader
-except ImportError:
-    print("Please install pypdf: pip install pypdf")
-    raise SystemExit(1)
-
 try:
     import mysql.connector
-    from mysql.connector import Error as MySQLError
+    from mysql.connector import HAVE_CEXT, Error as MySQLError
 except ImportError:
     print("Please install mysql-connector-python: pip install mysql-connector-python")
     raise SystemExit(1)
 
+from utils.pdf_cache import iter_pages_cached
+from utils.regex import compile_linear
+
 
 def get_db_connection(db_config: dict) -> mysql.connector.MySQLConnection | None:
     """Create and return a MySQL connection, handling 'database not available'."""
+    if not HAVE_CEXT:
+        print("Note: mysql-connector C extension not available; using the pure-Python protocol.")
     try:
         conn = mysql.connector.connect(
             host=db_config.get("host", "localhost"),
@@ -31,10 +32,13 @@ def get_db_connection(db_config: dict) -> mysql.connector.MySQLConnection | None
             user=db_config.get("user"),
             password=db_config.get("password"),
             database=db_config.get("database"),
+            # Pack the protocol in C when the extension is installed.
+            use_pure=not HAVE_CEXT,
         )
         if not conn.is_connected():
             print("Error: Database not available (connection not established).")
             return None
+        conn.autocommit = False
         return conn
     except (MySQLError, ValueError, TypeError) as e:
         print(f"Error: Database not available ({e}).")
@@ -64,25 +68,69 @@ def ensure_question_table(conn: mysql.connector.MySQLConnection) -> bool:
         return False
 
 
-def insert_question(
-    conn: mysql.connector.MySQLConnection,
-    subject_name: str,
-    question_text: str,
-    answer_options: str,
-    chapter_name: str,
+# Rows per INSERT statement; bounds the size of each packet sent to MySQL.
+INSERT_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=4)
+def _insert_sql(row_count: int) -> str:
+    """Return the multi-row INSERT for row_count rows.
+
+    Cached so every full batch passes the same string object, which lets a
+    prepared cursor reuse its server-side statement instead of re-preparing.
+    """
+    placeholders = ", ".join(["(%s, %s, %s, %s)"] * row_count)
+    return (
+        "INSERT INTO Question (subject_name, question_text, answer_options, chapter_name) "
+        f"VALUES {placeholders}"
+    )
+
+
+def insert_questions(
+    cur: mysql.connector.cursor.MySQLCursorPrepared,
+    rows: list[tuple[str, str, str, str]],
 ) -> None:
-    """Insert a single question row, handling DB operation errors."""
-    sql = """
-    INSERT INTO Question (subject_name, question_text, answer_options, chapter_name)
-    VALUES (%s, %s, %s, %s);
+    """Insert (subject_name, question_text, answer_options, chapter_name) rows in batches.
+
+    Each batch is one multi-row INSERT on a prepared cursor: a single round
+    trip per batch, and the statement is only parsed when the batch size
+    changes.
     """
-    try:
-        cur = conn.cursor()
-        cur.execute(sql, (subject_name, question_text, answer_options, chapter_name))
-        conn.commit()
-        cur.close()
-    except MySQLError as e:
-        print(f"Error inserting question into database: {e}")
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[start:start + INSERT_BATCH_SIZE]
+        cur.execute(_insert_sql(len(batch)), [value for row in batch for value in row])
+
+
+def iter_chapters(
+    pages: Iterable[str], chapter_pattern: re.Pattern
+) -> Iterator[tuple[str, str, int, int]]:
+    """Yield (chapter_name, text, start, end) for each chapter, in order.
+
+    The chapter is text[start:end]; indices are returned instead of a slice
+    so the chapter is never copied out. A chapter within one page uses the
+    page string itself, and one spanning pages joins just those pages, so
+    the whole document is never joined into a single string. Text before
+    the first chapter heading is ignored.
+    """
+    chapter_name: str | None = None
+    chapter_pages: list[str] = []  # pages before the current one
+    chapter_start = 0  # offset of the heading in the chapter's first page
+    for page_text in pages:
+        for chap_match in chapter_pattern.finditer(page_text):
+            if chapter_name is not None:
+                text = "\n".join(chapter_pages + [page_text])
+                chapter_end = len(text) - len(page_text) + chap_match.start()
+                yield chapter_name, text, chapter_start, chapter_end
+            chapter_name = chap_match.group("chapter").strip()
+            chapter_pages = []
+            chapter_start = chap_match.start()
+
+        if chapter_name is not None:
+            chapter_pages.append(page_text)
+
+    if chapter_name is not None:
+        text = "\n".join(chapter_pages)
+        yield chapter_name, text, chapter_start, len(text)
 
 
 def main():
@@ -121,8 +169,9 @@ def main():
         return
 
     try:
-        question_pattern = re.compile(regex_pattern, re.DOTALL)
-        chapter_pattern = re.compile(chapter_regex, re.MULTILINE)
+        # RE2 (when installed) scans the whole PDF text in linear time.
+        question_pattern = compile_linear(regex_pattern, re.DOTALL)
+        chapter_pattern = compile_linear(chapter_regex, re.MULTILINE)
     except re.error as e:
         print(f"Error: Invalid regular expression in configuration: {e}")
         return
@@ -149,51 +198,46 @@ def main():
     pdf_path = pdf_files[0]
     print(f"\nLoading questions from: {pdf_path.name}")
 
-    try:
-        reader = PdfReader(pdf_path)
-    except Exception as e:
-        print(f"Error opening PDF file {pdf_path.name}: {e}")
-        conn.close()
-        return
-
-    full_text_parts: list[str] = []
-    for page_index, page in enumerate(reader.pages, start=1):
-        try:
-            page_text = page.extract_text() or ""
-            full_text_parts.append(page_text)
-        except Exception as e:
-            print(f"Warning: Error reading page {page_index}: {e}")
-
-    full_text = "\n".join(full_text_parts)
-
     default_subject = config.get("subject_name", "Unknown Subject")
+    rows: list[tuple[str, str, str, str]] = []
     stored_count = 0
 
-    # Chapter-wise parsing
-    for chap_match in chapter_pattern.finditer(full_text):
-        chapter_start = chap_match.start()
-        chapter_name = chap_match.group("chapter").strip()
+    cur = conn.cursor(prepared=True)
+    try:
+        # Cached text is reused; otherwise the PDF is memory-mapped once and
+        # its pages are streamed in as they are extracted.
+        pages = iter_pages_cached(pdf_path, skip_errors=True)
 
-        next_chap = chapter_pattern.search(full_text, chap_match.end())
-        chapter_end = next_chap.start() if next_chap else len(full_text)
+        # Chapter-wise parsing, streamed page by page
+        for chapter_name, text, start, end in iter_chapters(pages, chapter_pattern):
+            chapter_count = 0
+            for match in question_pattern.finditer(text, start, end):
+                question_text = match.group("question").strip()
+                options = match.group("options").strip()
 
-        chapter_text = full_text[chapter_start:chapter_end]
+                rows.append((default_subject, question_text, options, chapter_name))
+                chapter_count += 1
 
-        for match in question_pattern.finditer(chapter_text):
-            question_text = match.group("question").strip()
-            options = match.group("options").strip()
+            print(f"  {chapter_name}: {chapter_count} question(s)")
 
-            insert_question(
-                conn=conn,
-                subject_name=default_subject,
-                question_text=question_text,
-                answer_options=options,
-                chapter_name=chapter_name,
-            )
-            stored_count += 1
+            if len(rows) >= INSERT_BATCH_SIZE:
+                insert_questions(cur, rows)
+                stored_count += len(rows)
+                rows.clear()
 
-    print(f"Stored {stored_count} question(s) in the MySQL database '{db_config.get('database')}'.")
-    conn.close()
+        insert_questions(cur, rows)
+        stored_count += len(rows)
+        conn.commit()
+        print(f"Stored {stored_count} question(s) in the MySQL database '{db_config.get('database')}'.")
+    except MySQLError as e:
+        conn.rollback()
+        print(f"Error inserting questions into database: {e}")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error reading PDF file {pdf_path.name}: {e}")
+    finally:
+        cur.close()
+        conn.close()
 
 
 if __name__ == "__main__":
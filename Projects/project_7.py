@@ -4,21 +4,88 @@ and write the fetched content to output.txt."""
 from __future__ import annotations
 
 from pathlib import Path
-import concurrent.futures
-import xml.etree.ElementTree as ET
-
-import requests
-
-
-def fetch_url(url: str, timeout: float = 10.0) -> str:
-    """Fetch the content of a URL, returning an empty string on error."""
-    try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        return response.text
-    except Exception as e:  # noqa: BLE001
-        print(f"Error fetching {url}: {e}")
-        return ""
+from typing import BinaryIO
+import asyncio
+import codecs
+import shutil
+import tempfile
+
+import aiohttp
+
+try:
+    from lxml import etree
+    XMLParseError = etree.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as etree
+    XMLParseError = etree.ParseError
+
+CHUNK_SIZE = 64 * 1024
+# Bodies up to this size are spooled in memory; larger ones go to a temp file.
+SPOOL_MAX_SIZE = 1 << 20
+# Upper bound on simultaneous connections held by the session.
+MAX_CONNECTIONS = 64
+
+
+async def fetch_url(session: aiohttp.ClientSession, url: str, out_fh: BinaryIO) -> bool:
+    """Stream the content of a URL into out_fh, returning False on error."""
+    # Download into a spool first so a failed fetch never leaves a partial
+    # entry behind and concurrent fetches don't interleave in the output.
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as body:
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                try:
+                    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")("replace")
+                except LookupError:
+                    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    body.write(decoder.decode(chunk).encode("utf-8"))
+                body.write(decoder.decode(b"", final=True).encode("utf-8"))
+        except Exception as e:  # noqa: BLE001
+            print(f"Error fetching {url}: {e}")
+            return False
+
+        if body.tell() == 0:
+            return False
+
+        # No await below, so this entry is written in one piece.
+        body.seek(0)
+        out_fh.write(f"URL: {url}\n{'=' * 80}\n".encode("utf-8"))
+        shutil.copyfileobj(body, out_fh, CHUNK_SIZE)
+        out_fh.write(b"\n\n")
+        return True
+
+
+async def fetch_all(urls: list[str], out_fh: BinaryIO, timeout: float = 10.0) -> int:
+    """Fetch all URLs concurrently into out_fh and return how many succeeded."""
+    # One session for every URL: connections are pooled and kept alive, so
+    # links on the same host reuse the TCP/TLS connection.
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    # Per-socket limits only: a total timeout would also count the time a
+    # request waits for a free connection and the time spent streaming its body.
+    client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        results = await asyncio.gather(
+            *(fetch_url(session, url, out_fh) for url in urls),
+            return_exceptions=True,
+        )
+
+    fetched_count = 0
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            print(f"Unexpected error fetching {url}: {result}")
+        elif result:
+            fetched_count += 1
+    return fetched_count
+
+
+def is_blank_file(path: Path) -> bool:
+    """Return True if the file holds only whitespace, reading only up to the first other byte."""
+    with path.open("rb") as fh:
+        while chunk := fh.read(CHUNK_SIZE):
+            if chunk.strip():
+                return False
+    return True
 
 
 def main() -> None:
@@ -31,66 +98,52 @@ def main() -> None:
         print(f"Error: RSS XML file not found at {rss_path}")
         return
 
-    # Read XML file
+    # 2. Take care of case where xml file is empty
     try:
-        xml_text = rss_path.read_text(encoding="utf-8").strip()
+        if is_blank_file(rss_path):
+            print("Error: RSS XML file is empty.")
+            return
     except OSError as e:
         print(f"Error reading RSS XML file: {e}")
         return
 
-    # 2. Take care of case where xml file is empty
-    if not xml_text:
-        print("Error: RSS XML file is empty.")
-        return
-
-    # Parse XML
+    # 2. Loop through each link (all <link> elements in the RSS), parsing
+    # the file as a stream instead of building the whole tree first.
+    links: list[str] = []
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
+        for _, elem in etree.iterparse(str(rss_path), events=("end",)):
+            if elem.tag == "link":
+                text = (elem.text or "").strip()
+                if text:
+                    links.append(text)
+            elem.clear()
+    except XMLParseError as e:
         print(f"Error: Failed to parse RSS XML file: {e}")
         return
+    except OSError as e:
+        print(f"Error reading RSS XML file: {e}")
+        return
 
-    # 2. Loop through each link (all <link> elements in the RSS)
-    links: list[str] = []
-    for link_elem in root.iter("link"):
-        text = (link_elem.text or "").strip()
-        if text:
-            links.append(text)
+    # Channel- and item-level links often repeat; fetch each URL once,
+    # keeping the order in which they appear.
+    links = list(dict.fromkeys(links))
 
     if not links:
         print("No <link> elements found in RSS XML.")
         return
 
-    print(f"Found {len(links)} link(s) in RSS. Fetching in parallel...")
-
-    # 4. Execute reading from multiple links in parallel
-    fetched_contents: list[tuple[str, str]] = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_url = {executor.submit(fetch_url, url): url for url in links}
-        for future in concurrent.futures.as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                content = future.result()
-            except Exception as e:  # noqa: BLE001
-                print(f"Unexpected error fetching {url}: {e}")
-                content = ""
-
-            if content:
-                fetched_contents.append((url, content))
+    print(f"Found {len(links)} unique link(s) in RSS. Fetching in parallel...")
 
     # 3. Extract content from each link and write to “output.txt”
+    # 4. Execute reading from multiple links in parallel
     output_path = content_dir / "output.txt"
     try:
-        if not fetched_contents:
-            output_text = "No content could be fetched from any link.\n"
-        else:
-            parts: list[str] = []
-            for url, content in fetched_contents:
-                parts.append(f"URL: {url}\n{'=' * 80}\n{content}\n")
-            output_text = "\n".join(parts)
-
-        output_path.write_text(output_text, encoding="utf-8")
-        print(f"Wrote fetched content from {len(fetched_contents)} link(s) to {output_path}")
+        with open(output_path, "wb", buffering=1 << 20) as out_fh:
+            fetched_count = asyncio.run(fetch_all(links, out_fh))
+            if not fetched_count:
+                out_fh.write(b"No content could be fetched from any link.\n")
+
+        print(f"Wrote fetched content from {fetched_count} link(s) to {output_path}")
     except OSError as e:
         print(f"Error writing to output file {output_path}: {e}")
 
@@ -11,131 +11,382 @@ Uses an interface (abstract base class) with inheritance for different question
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import ClassVar
 import json
+import os
+import queue
+import re
+import sys
+import tempfile
+import threading
 
 try:
     import mysql.connector
-    from mysql.connector import Error as MySQLError
+    from mysql.connector import HAVE_CEXT, Error as MySQLError, InterfaceError, OperationalError, errorcode
+    from mysql.connector.pooling import MySQLConnectionPool
 except ImportError:
     print("Please install mysql-connector-python: pip install mysql-connector-python")
     raise SystemExit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Questions are sent to the server in batches of this many rows (one round trip each).
+STORE_BATCH_SIZE = 40
+
+# Questions written per transaction; each commit costs a redo-log fsync.
+COMMIT_EVERY = 50
+
+# Rows per multi-row INSERT statement, keeping each one well under max_allowed_packet.
+INSERT_CHUNK_ROWS = 1000
+
+
+INSERT_SQL = (
+    "INSERT INTO Question_New (question_type, question_text, answer_options, subject_name, chapter_name) "
+    "VALUES (%s, %s, %s, %s, %s)"
+)
+
+
+@lru_cache(maxsize=4)
+def _insert_sql(row_count: int) -> str:
+    """Return INSERT_SQL extended to row_count rows.
+
+    Cached so every full chunk passes the same string object, which lets the
+    prepared cursor reuse its server-side statement instead of re-preparing.
+    """
+    if row_count == 1:
+        return INSERT_SQL
+    return INSERT_SQL + ", (%s, %s, %s, %s, %s)" * (row_count - 1)
+
+
+# Bulk import; the tab/newline/backslash escapes match _escape_tsv.
+LOAD_DATA_SQL = (
+    "LOAD DATA LOCAL INFILE %s INTO TABLE Question_New CHARACTER SET utf8mb4 "
+    "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+    "(question_type, question_text, answer_options, subject_name, chapter_name)"
+)
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _escape_tsv(value: str) -> str:
+    """Escape a field for LOAD DATA's default backslash escaping."""
+    return value.translate(_TSV_ESCAPES)
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes with orjson when it is installed, else with the json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def load_config(config_path: Path) -> dict:
+    """Read and parse config.json once per process.
+
+    Raises OSError or json.JSONDecodeError (orjson's error subclasses it).
+    """
+    return _loads(config_path.read_bytes())
+
+
+# Matches any text that is not blank.
+_NONEMPTY = re.compile(r"\S")
+
+# Connections kept open by the pool get_db_connection() hands out from. The
+# pool opens all of them up front and the script only ever holds one (used
+# by the writer thread), so a larger pool would just add handshakes.
+POOL_SIZE = 1
+_pool: MySQLConnectionPool | None = None
+
+
+@dataclass
+class QuestionWriter:
+    """Owns the connection and the one prepared cursor all inserts go through."""
+
+    conn: mysql.connector.MySQLConnection
+    _cursor: mysql.connector.cursor.MySQLCursorPrepared | None = field(default=None, repr=False)
+
+    def execute(self, rows: list[tuple[str, str, str, str, str]]) -> None:
+        """Insert rows with one multi-row INSERT, opening the cursor on first use."""
+        if self._cursor is None:
+            self._cursor = self.conn.cursor(prepared=True)
+        self._cursor.execute(_insert_sql(len(rows)), [value for row in rows for value in row])
+
+    def close(self) -> None:
+        """Close the prepared cursor, if one is open."""
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except MySQLError:
+                pass
+            self._cursor = None
+
 
 # Interface (Abstract Base Class) for Question
 class Question(ABC):
-    """Abstract base class defining the interface for all question types."""
+    """Abstract base class defining the interface for all question types.
+
+    Subclasses set QUESTION_TYPE, and ANSWER_OPTIONS when the options are
+    the same for every question of that type.
+    """
+
+    ANSWER_OPTIONS: ClassVar[str] = ""
+
+    # Rows waiting to be written by flush(), shared by all question types.
+    _pending: list[tuple[str, str, str, str, str]] = []
+
+    # Rows flushed since the last commit.
+    _uncommitted: int = 0
+
+    # Rows the server rejected; flush() reports and drops them.
+    _rejected: list[tuple[str, str, str, str, str]] = []
 
     def __init__(self, question_text: str, subject_name: str = "", chapter_name: str = ""):
         """Initialize a question with common attributes."""
         self.question_text = question_text
         self.subject_name = subject_name
         self.chapter_name = chapter_name
+        self._answer_options = self.ANSWER_OPTIONS
 
+    @property
     @abstractmethod
+    def QUESTION_TYPE(self) -> str:
+        """Type code stored in the question_type column; a class attribute in subclasses."""
+
     def get_question_type(self) -> str:
         """Return the type of question."""
-        pass
+        return self.QUESTION_TYPE
 
-    @abstractmethod
     def get_answer_options(self) -> str:
         """Return the answer options as a formatted string."""
-        pass
+        return self._answer_options
 
-    @abstractmethod
-    def store(self, conn: mysql.connector.MySQLConnection) -> bool:
-        """Store the question in the database. Returns True on success, False on failure."""
-        pass
+    def store(self, writer: QuestionWriter, batch_size: int = STORE_BATCH_SIZE) -> bool:
+        """Queue the question for storage, flushing once batch_size are pending.
 
+        The rows go into one open transaction that is committed every
+        COMMIT_EVERY questions, so each question does not pay for a log flush.
 
-# Concrete implementation: Subjective Question (Long Answer)
-class SubjectiveQuestion(Question):
-    """Subjective type question requiring a long answer."""
+        Returns True on success, False if a flush to the database failed.
+        """
+        Question._pending.append(
+            (
+                self.QUESTION_TYPE,
+                self.question_text,
+                self._answer_options,
+                self.subject_name,
+                self.chapter_name,
+            )
+        )
+        if len(Question._pending) + Question._uncommitted >= COMMIT_EVERY:
+            return Question.commit(writer)
+        if len(Question._pending) >= batch_size:
+            return Question.flush(writer)
+        return True
 
-    def __init__(self, question_text: str, subject_name: str = "", chapter_name: str = ""):
-        """Initialize a subjective question."""
-        super().__init__(question_text, subject_name, chapter_name)
+    @classmethod
+    def flush(cls, writer: QuestionWriter) -> bool:
+        """Write all queued questions with multi-row INSERTs, without committing.
 
-    def get_question_type(self) -> str:
-        """Return the question type."""
-        return "SUBJECTIVE"
+        On a connection error the unwritten rows stay queued for the next
+        flush. If the server rejects a chunk's data, the chunk is retried one
+        row at a time and each row it still rejects is reported and dropped,
+        so one bad question cannot hold up the ones queued after it. Returns
+        False if anything was left unwritten.
+        """
+        all_stored = True
+        while cls._pending:
+            chunk = cls._pending[:INSERT_CHUNK_ROWS]
+            try:
+                writer.execute(chunk)
+            except (OperationalError, InterfaceError) as e:
+                print(f"Error storing questions in database: {e}")
+                return False
+            except MySQLError:
+                # Only the failed statement is undone; find the row(s) at fault.
+                for row in chunk:
+                    try:
+                        writer.execute([row])
+                    except (OperationalError, InterfaceError) as e:
+                        print(f"Error storing questions in database: {e}")
+                        return False
+                    except MySQLError as e:
+                        print(f"Error: question {row[1][:60]!r} was not stored ({e}).")
+                        Question._rejected.append(row)
+                        all_stored = False
+                    else:
+                        Question._uncommitted += 1
+                    del cls._pending[0]
+                continue
+            del cls._pending[:len(chunk)]
+            Question._uncommitted += len(chunk)
+        return all_stored
+
+    @classmethod
+    def commit(cls, writer: QuestionWriter) -> bool:
+        """Flush queued questions and commit the open transaction.
+
+        Rows that were written are committed even if flush() had to drop some.
+        """
+        flushed = cls.flush(writer)
+        if not Question._uncommitted:
+            return flushed
+        try:
+            writer.conn.commit()
+            Question._uncommitted = 0
+            return flushed
+        except MySQLError as e:
+            print(f"Error committing questions to database: {e}")
+            return False
 
-    def get_answer_options(self) -> str:
-        """Subjective questions don't have predefined options."""
-        return ""
-
-    def store(self, conn: mysql.connector.MySQLConnection) -> bool:
-        """Store the subjective question in the database."""
-        sql = """
-        INSERT INTO Question_New (question_type, question_text, answer_options, subject_name, chapter_name)
-        VALUES (%s, %s, %s, %s, %s);
+    @staticmethod
+    def bulk_load(conn: mysql.connector.MySQLConnection, questions: Iterable[Question]) -> int | None:
+        """Import many questions at once with LOAD DATA LOCAL INFILE.
+
+        The rows are written to a tab-separated temp file that the server reads
+        in one pass, skipping per-row INSERT parsing. Returns the number of
+        rows loaded, or None on failure.
         """
+        fd, tsv_path = tempfile.mkstemp(suffix=".tsv", prefix="questions_")
         try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                for question in questions:
+                    fields = (
+                        question.QUESTION_TYPE,
+                        question.question_text,
+                        question._answer_options,
+                        question.subject_name,
+                        question.chapter_name,
+                    )
+                    f.write("\t".join(_escape_tsv(field) for field in fields))
+                    f.write("\n")
             cur = conn.cursor()
-            cur.execute(
-                sql,
-                (
-                    self.get_question_type(),
-                    self.question_text,
-                    self.get_answer_options(),
-                    self.subject_name,
-                    self.chapter_name,
-                ),
-            )
+            cur.execute(LOAD_DATA_SQL, (tsv_path,))
+            loaded = cur.rowcount
             conn.commit()
             cur.close()
-            return True
+            return loaded
+        except (MySQLError, OSError) as e:
+            conn.rollback()
+            print(f"Error bulk loading questions into database: {e}")
+            return None
+        finally:
+            try:
+                os.unlink(tsv_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def bulk_import(conn: mysql.connector.MySQLConnection, questions: Iterable[Question]) -> int | None:
+        """Bulk load questions with InnoDB's load-time checks relaxed, then refresh index stats.
+
+        idx_subject_chapter is dropped for the load and rebuilt once afterwards
+        instead of being updated row by row. For batch imports only; returns
+        the number of rows loaded, or None on failure.
+        """
+        cur = None
+        try:
+            cur = conn.cursor()
+            # InnoDB ignores ALTER TABLE ... DISABLE KEYS; these session
+            # settings are its equivalent for a bulk load.
+            cur.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+            try:
+                # Add the index afterwards only when it is known to be absent,
+                # so a failed drop is reported instead of a duplicate key name.
+                add_index = False
+                try:
+                    cur.execute("ALTER TABLE Question_New DROP INDEX idx_subject_chapter")
+                    add_index = True
+                except MySQLError as e:
+                    # Tables created before the index was added have none to drop.
+                    if e.errno != errorcode.ER_CANT_DROP_FIELD_OR_KEY:
+                        raise
+                    add_index = True
+                try:
+                    loaded = Question.bulk_load(conn, questions)
+                finally:
+                    if add_index:
+                        cur.execute(
+                            "ALTER TABLE Question_New ADD INDEX idx_subject_chapter (subject_name, chapter_name)"
+                        )
+            finally:
+                cur.execute("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+            if loaded is not None:
+                cur.execute("ANALYZE TABLE Question_New")
+                cur.fetchall()
+            return loaded
         except MySQLError as e:
-            print(f"Error storing subjective question in database: {e}")
-            return False
+            print(f"Error bulk importing questions into database: {e}")
+            return None
+        finally:
+            if cur is not None:
+                try:
+                    cur.close()
+                except MySQLError:
+                    pass
+
+    @staticmethod
+    def iter_all(conn: mysql.connector.MySQLConnection) -> Iterator[tuple[str, str, str, str, str]]:
+        """Yield (question_type, question_text, answer_options, subject_name, chapter_name) rows.
+
+        Rows are streamed from an unbuffered cursor, so memory stays flat however
+        large the table is. Callers must exhaust or close() the iterator before
+        using the connection again.
+        """
+        cur = conn.cursor(buffered=False)
+        try:
+            cur.execute(
+                "SELECT question_type, question_text, answer_options, subject_name, chapter_name "
+                "FROM Question_New ORDER BY id"
+            )
+            yield from cur
+        finally:
+            # Read off anything left when the caller stops early, so the
+            # connection is usable again.
+            try:
+                cur.fetchall()
+            except MySQLError:
+                pass
+            cur.close()
+
+
+# Concrete implementation: Subjective Question (Long Answer)
+class SubjectiveQuestion(Question):
+    """Subjective type question requiring a long answer."""
+
+    QUESTION_TYPE: ClassVar[str] = "SUBJECTIVE"
+
+    def __init__(self, question_text: str, subject_name: str = "", chapter_name: str = ""):
+        """Initialize a subjective question."""
+        super().__init__(question_text, subject_name, chapter_name)
 
 
 # Concrete implementation: True/False Question
 class TrueFalseQuestion(Question):
     """Objective type question with True/False answer options."""
 
+    QUESTION_TYPE: ClassVar[str] = "TRUE_FALSE"
+    ANSWER_OPTIONS: ClassVar[str] = "True\nFalse"
+
     def __init__(self, question_text: str, subject_name: str = "", chapter_name: str = ""):
         """Initialize a True/False question."""
         super().__init__(question_text, subject_name, chapter_name)
 
-    def get_question_type(self) -> str:
-        """Return the question type."""
-        return "TRUE_FALSE"
-
-    def get_answer_options(self) -> str:
-        """Return True/False as the answer options."""
-        return "True\nFalse"
-
-    def store(self, conn: mysql.connector.MySQLConnection) -> bool:
-        """Store the True/False question in the database."""
-        sql = """
-        INSERT INTO Question_New (question_type, question_text, answer_options, subject_name, chapter_name)
-        VALUES (%s, %s, %s, %s, %s);
-        """
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                sql,
-                (
-                    self.get_question_type(),
-                    self.question_text,
-                    self.get_answer_options(),
-                    self.subject_name,
-                    self.chapter_name,
-                ),
-            )
-            conn.commit()
-            cur.close()
-            return True
-        except MySQLError as e:
-            print(f"Error storing True/False question in database: {e}")
-            return False
-
 
 # Concrete implementation: Multiple Choice Question
 class MultipleChoiceQuestion(Question):
     """Objective type question with multiple answer choices."""
 
+    QUESTION_TYPE: ClassVar[str] = "MULTIPLE_CHOICE"
+
     def __init__(
         self,
         question_text: str,
@@ -146,51 +397,37 @@ class MultipleChoiceQuestion(Question):
         """Initialize a multiple choice question with a list of choices."""
         super().__init__(question_text, subject_name, chapter_name)
         self.choices = choices if choices else []
-
-    def get_question_type(self) -> str:
-        """Return the question type."""
-        return "MULTIPLE_CHOICE"
-
-    def get_answer_options(self) -> str:
-        """Return the answer choices as a formatted string."""
-        return "\n".join(self.choices)
-
-    def store(self, conn: mysql.connector.MySQLConnection) -> bool:
-        """Store the multiple choice question in the database."""
-        sql = """
-        INSERT INTO Question_New (question_type, question_text, answer_options, subject_name, chapter_name)
-        VALUES (%s, %s, %s, %s, %s);
-        """
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                sql,
-                (
-                    self.get_question_type(),
-                    self.question_text,
-                    self.get_answer_options(),
-                    self.subject_name,
-                    self.chapter_name,
-                ),
-            )
-            conn.commit()
-            cur.close()
-            return True
-        except MySQLError as e:
-            print(f"Error storing multiple choice question in database: {e}")
-            return False
+        # Joined once here rather than on every store().
+        self._answer_options = "\n".join(self.choices)
 
 
 def get_db_connection(db_config: dict) -> mysql.connector.MySQLConnection | None:
-    """Create and return a MySQL connection, handling 'database not available'."""
+    """Return a MySQL connection from the pool, handling 'database not available'.
+
+    The pool is created on first use; closing the connection returns it to
+    the pool instead of tearing down the TCP session.
+    """
+    global _pool
     try:
-        conn = mysql.connector.connect(
-            host=db_config.get("host", "localhost"),
-            port=int(db_config.get("port", 3306)),
-            user=db_config.get("user"),
-            password=db_config.get("password"),
-            database=db_config.get("database"),
-        )
+        if _pool is None:
+            if not HAVE_CEXT:
+                print("Note: mysql-connector C extension not available; using the pure-Python protocol.")
+            _pool = MySQLConnectionPool(
+                pool_name="q",
+                pool_size=POOL_SIZE,
+                host=db_config.get("host", "localhost"),
+                port=int(db_config.get("port", 3306)),
+                user=db_config.get("user"),
+                password=db_config.get("password"),
+                database=db_config.get("database"),
+                # Question.bulk_load only ever sends files from the temp directory.
+                allow_local_infile_in_path=tempfile.gettempdir(),
+                # Pack the protocol in C when the extension is installed.
+                use_pure=not HAVE_CEXT,
+                # Part of the pool config, so it is reapplied on every checkout.
+                autocommit=False,
+            )
+        conn = _pool.get_connection()
         if not conn.is_connected():
             print("Error: Database not available (connection not established).")
             return None
@@ -211,13 +448,33 @@ def ensure_question_table(conn: mysql.connector.MySQLConnection) -> bool:
         subject_name VARCHAR(255) NULL,
         chapter_name VARCHAR(255) NULL,
         PRIMARY KEY (id),
-        INDEX idx_question_type (question_type)
-    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        INDEX idx_question_type (question_type),
+        INDEX idx_subject_chapter (subject_name, chapter_name)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8;
     """
     try:
         cur = conn.cursor()
+        # DDL commits implicitly, so no separate commit is needed.
         cur.execute(create_sql)
-        conn.commit()
+        # CREATE TABLE IF NOT EXISTS leaves tables from older versions of this
+        # script as they were; bring them up to the definition above.
+        cur.execute(
+            "SELECT COUNT(*) FROM information_schema.statistics"
+            " WHERE table_schema = DATABASE() AND table_name = 'Question_New'"
+            " AND index_name = 'idx_subject_chapter'"
+        )
+        (index_count,) = cur.fetchone()
+        if not index_count:
+            cur.execute("ALTER TABLE Question_New ADD INDEX idx_subject_chapter (subject_name, chapter_name)")
+        # create_options records the requested format even where the server
+        # cannot honour it, so this does not rebuild the table on every run.
+        cur.execute(
+            "SELECT create_options FROM information_schema.tables"
+            " WHERE table_schema = DATABASE() AND table_name = 'Question_New'"
+        )
+        (create_options,) = cur.fetchone()
+        if "row_format=compressed" not in (create_options or "").lower():
+            cur.execute("ALTER TABLE Question_New ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8")
         cur.close()
         return True
     except MySQLError as e:
@@ -225,17 +482,128 @@ def ensure_question_table(conn: mysql.connector.MySQLConnection) -> bool:
         return False
 
 
+def _scalar_text(value: object) -> str | None:
+    """Return a JSON string, number or boolean as text; None for anything else."""
+    if isinstance(value, (str, int, float, bool)):
+        return str(value)
+    return None
+
+
+def load_questions_file(
+    questions_path: Path, default_subject: str, default_chapter: str
+) -> list[Question] | None:
+    """Build questions from a JSON seed file for bulk import.
+
+    The file holds a list of objects with question_type (SUBJECTIVE,
+    TRUE_FALSE or MULTIPLE_CHOICE), question_text, and optionally choices,
+    subject_name and chapter_name.
+    """
+    try:
+        entries = _loads(questions_path.read_bytes())
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Failed to read questions file {questions_path}: {e}")
+        return None
+    if not isinstance(entries, list):
+        print(f"Error: Questions file {questions_path} must contain a JSON list.")
+        return None
+
+    questions: list[Question] = []
+    for number, entry in enumerate(entries, start=1):
+        question_text = entry.get("question_text") if isinstance(entry, dict) else None
+        if not isinstance(question_text, str) or not _NONEMPTY.search(question_text):
+            print(f"Error: Entry {number} in {questions_path.name} has no question_text.")
+            return None
+        question_text = question_text.strip()
+        # Numbers and booleans are stored as their text; null or "" means use the default.
+        subject = entry.get("subject_name")
+        chapter = entry.get("chapter_name")
+        subject = default_subject if subject in (None, "") else _scalar_text(subject)
+        chapter = default_chapter if chapter in (None, "") else _scalar_text(chapter)
+        if subject is None or chapter is None:
+            print(f"Error: Entry {number} in {questions_path.name} has a subject_name or chapter_name that is not text.")
+            return None
+        question_type = entry.get("question_type")
+        if question_type == "SUBJECTIVE":
+            questions.append(SubjectiveQuestion(question_text, subject, chapter))
+        elif question_type == "TRUE_FALSE":
+            questions.append(TrueFalseQuestion(question_text, subject, chapter))
+        elif question_type == "MULTIPLE_CHOICE":
+            choices = entry.get("choices") or []
+            if not isinstance(choices, list):
+                print(f"Error: Entry {number} in {questions_path.name} has choices that are not a JSON list.")
+                return None
+            choices = [_scalar_text(choice) for choice in choices]
+            if None in choices:
+                print(f"Error: Entry {number} in {questions_path.name} has a choice that is null or not text.")
+                return None
+            questions.append(MultipleChoiceQuestion(question_text, choices, subject, chapter))
+        else:
+            print(f"Error: Entry {number} in {questions_path.name} has unknown question_type {question_type!r}.")
+            return None
+    return questions
+
+
+def drain_queue(questions: queue.Queue, max_items: int) -> list[Question | None]:
+    """Block for one queued item, then take up to max_items without waiting."""
+    items = [questions.get()]
+    try:
+        while len(items) < max_items:
+            items.append(questions.get_nowait())
+    except queue.Empty:
+        pass
+    return items
+
+
+def run_question_writer(conn: mysql.connector.MySQLConnection, questions: queue.Queue) -> None:
+    """Consumer thread: store and commit queued questions until a None arrives.
+
+    Whatever has queued up while the user was typing is written as one
+    batch, so the connection is busy only when there is work to send.
+    """
+    writer = QuestionWriter(conn)
+    try:
+        while True:
+            batch = drain_queue(questions, COMMIT_EVERY)
+            stored = [question.store(writer) for question in batch if question is not None]
+            if not (Question.commit(writer) and all(stored)) and Question._pending:
+                # Rejected rows were named by flush(); these are waiting on the connection.
+                print(
+                    f"Error: {len(Question._pending)} question(s) are not stored yet, "
+                    f"starting with {Question._pending[0][1][:60]!r}."
+                )
+            if None in batch:
+                return
+    finally:
+        writer.close()
+
+
+def report_unstored(questions: queue.Queue) -> None:
+    """After the writer thread has stopped, say which questions never reached the database."""
+    unstored = [row[1] for row in Question._rejected + Question._pending]
+    while not questions.empty():
+        question = questions.get_nowait()
+        if question is not None:
+            unstored.append(question.question_text)
+    # Rows written but never committed are rolled back with the transaction.
+    lost = len(unstored) + Question._uncommitted
+    if not lost:
+        return
+    print(f"Warning: {lost} question(s) were not stored.")
+    for text in unstored:
+        print(f"  - {text[:60]}")
+
+
 def prompt_non_empty(prompt_text: str) -> str:
     """Prompt user until a non-empty string is entered."""
     while True:
-        value = input(prompt_text).strip()
-        if value:
-            return value
+        value = input(prompt_text)
+        if _NONEMPTY.search(value):
+            return value.strip()
         print("  Input cannot be empty. Please try again.")
 
 
-def run_interactive_menu(conn: mysql.connector.MySQLConnection, default_subject: str, default_chapter: str) -> None:
-    """Interactive interface: user selects question type, enters question, and stores in database."""
+def run_interactive_menu(questions: queue.Queue, default_subject: str, default_chapter: str) -> None:
+    """Interactive interface: user selects question type, enters question, and queues it for storage."""
     while True:
         print("\n" + "=" * 50)
         print("  Question Management")
@@ -293,14 +661,16 @@ def run_interactive_menu(conn: mysql.connector.MySQLConnection, default_subject:
                 chapter_name=chapter,
             )
 
-        if question and question.store(conn):
-            print(f"Question stored successfully ({question.get_question_type()}).")
-        elif question:
-            print("Failed to store question. See error above.")
+        if question:
+            questions.put(question)
+            print(f"Question queued for storage ({question.get_question_type()}).")
 
 
 def main() -> None:
-    """Main: load config, connect to DB, then run interactive interface."""
+    """Main: load config, connect to DB, then run interactive interface.
+
+    Given a JSON questions file as the first argument, bulk imports it instead.
+    """
     root_dir = Path(__file__).parent.parent
     configs_dir = root_dir / "Configs"
 
@@ -310,8 +680,7 @@ def main() -> None:
         return
 
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = load_config(config_path)
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse configuration file: {e}")
         return
@@ -339,7 +708,27 @@ def main() -> None:
     default_chapter = config.get("chapter_name", "")
 
     print(f"Connected to database '{db_config.get('database')}'.")
-    run_interactive_menu(conn, default_subject, default_chapter)
+    if len(sys.argv) > 1:
+        # Batch mode: bulk import a JSON seed file instead of prompting.
+        questions = load_questions_file(Path(sys.argv[1]), default_subject, default_chapter)
+        if questions is not None:
+            loaded = Question.bulk_import(conn, questions)
+            if loaded is not None:
+                print(f"Loaded {loaded} question(s) from {sys.argv[1]}.")
+    else:
+        # From here on only the writer thread uses the connection.
+        questions: queue.Queue = queue.Queue()
+        writer_thread = threading.Thread(target=run_question_writer, args=(conn, questions), daemon=True)
+        writer_thread.start()
+        try:
+            run_interactive_menu(questions, default_subject, default_chapter)
+        except KeyboardInterrupt:
+            print("\nInterrupted.")
+        finally:
+            # Let the writer store and commit what is left, then stop.
+            questions.put(None)
+            writer_thread.join()
+        report_unstored(questions)
 
     try:
         conn.close()
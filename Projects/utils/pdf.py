@@ -0,0 +1,189 @@
+"""PDF text extraction shared by the Projects scripts.
+
+Uses pypdfium2 (PDFium, a C library) when it is installed and falls back to
+pypdf otherwise.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+import io
+import mmap
+import os
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        print("Please install pypdfium2 or pypdf: pip install pypdfium2")
+        raise SystemExit(1)
+
+# Name of the extraction library in use; text differs slightly between them.
+BACKEND = "pypdfium2" if pdfium is not None else "pypdf"
+
+# A PDF can be given as a file path, its raw bytes, or an mmap of the file.
+PdfSource = str | Path | bytes | mmap.mmap
+
+# Document opened by each worker process in iter_pages.
+_worker_document = None
+
+
+class _MmapReader(io.RawIOBase):
+    """Seekable read-only stream over an mmap, so PDFium can read it without a copy."""
+
+    def __init__(self, data: mmap.mmap):
+        self._data = data
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: len(self._data)}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        chunk = self._data[self._position:self._position + len(buffer)]
+        memoryview(buffer).cast("B")[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+
+def _open(source: PdfSource):
+    """Open a PDF document from a path or an in-memory buffer."""
+    if pdfium is not None:
+        if isinstance(source, mmap.mmap):
+            source = _MmapReader(source)
+        return pdfium.PdfDocument(source)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return PdfReader(source, strict=False)
+
+
+def _page_text(document, page_index: int) -> str:
+    """Extract the text of one page of an open document."""
+    if pdfium is not None:
+        # PDFium reports line breaks as CRLF; normalise to match pypdf.
+        text = document[page_index].get_textpage().get_text_range()
+        return text.replace("\r\n", "\n")
+    # Index straight to the page; never iterate document.pages.
+    page = document.pages[page_index]
+    if page.get("/Contents") is None:
+        # Nothing is drawn on this page, so there is no text to decode.
+        return ""
+    return page.extract_text() or ""
+
+
+@lru_cache(maxsize=4)
+def _open_document(pdf_path: str):
+    """Open a PDF once per process; the few most recent stay open."""
+    return _open(pdf_path)
+
+
+def _document_length(document) -> int:
+    """Return the number of pages in an open document."""
+    if pdfium is not None:
+        return len(document)
+    return document.get_num_pages()
+
+
+def page_count(source: PdfSource) -> int:
+    """Return the number of pages in the PDF."""
+    if isinstance(source, (str, Path)):
+        return _document_length(_open_document(str(source)))
+    document = _open(source)
+    try:
+        return _document_length(document)
+    finally:
+        if pdfium is not None:
+            document.close()
+
+
+@lru_cache(maxsize=4096)
+def _cached_page_text(pdf_path: str, page_index: int) -> str:
+    """Extract a page of an already-open document, memoised by (path, index)."""
+    return _page_text(_open_document(pdf_path), page_index)
+
+
+def read_page(pdf_path: str | Path, page_index: int) -> str:
+    """Extract the text of a single page (0-based index).
+
+    Open documents and page texts are memoised per process, so asking for
+    the same page again does not extract it again.
+    """
+    return _cached_page_text(str(pdf_path), page_index)
+
+
+def _read_page_from(document, page_index: int, skip_errors: bool) -> str:
+    """Extract one page, optionally warning and returning "" on failure."""
+    try:
+        return _page_text(document, page_index)
+    except Exception as e:
+        if not skip_errors:
+            raise
+        print(f"Warning: Error reading page {page_index + 1}: {e}")
+        return ""
+
+
+def _init_worker(source: str | Path | bytes) -> None:
+    """Open the PDF once when a worker process starts."""
+    global _worker_document
+    _worker_document = _open(source)
+
+
+def _worker_page(page_index: int, skip_errors: bool) -> str:
+    """Extract one page inside a worker process."""
+    return _read_page_from(_worker_document, page_index, skip_errors)
+
+
+def iter_pages(
+    source: PdfSource, skip_errors: bool = False, max_workers: int | None = None
+) -> Iterator[str]:
+    """Yield the text of every page in order, extracting pages in parallel.
+
+    With skip_errors, an unreadable page yields "" instead of raising.
+    max_workers defaults to one process per core; 1 extracts in-process,
+    which callers already running inside a worker pool should use.
+    """
+    # Parse the document once here; in-process extraction reuses it.
+    document = _open(source)
+    total_pages = _document_length(document)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, total_pages))
+    if workers == 1:
+        try:
+            for page_index in range(total_pages):
+                yield _read_page_from(document, page_index, skip_errors)
+        finally:
+            if pdfium is not None:
+                document.close()
+        return
+    if pdfium is not None:
+        document.close()
+
+    if isinstance(source, mmap.mmap):
+        # An mmap cannot be pickled; hand the mapped bytes to each worker once
+        # instead of having every worker re-read the file from disk.
+        source = bytes(source)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(source,)
+    ) as executor:
+        # executor.map yields results in page order.
+        yield from executor.map(
+            partial(_worker_page, skip_errors=skip_errors), range(total_pages), chunksize=8
+        )
+
+
+def read_pdf(source: PdfSource, skip_errors: bool = False, max_workers: int | None = None) -> str:
+    """Read and extract text from a PDF file."""
+    return "\n".join(iter_pages(source, skip_errors, max_workers))
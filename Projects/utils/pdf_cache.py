@@ -0,0 +1,91 @@
+"""On-disk cache of extracted PDF text.
+
+Entries live under ~/.cache/pdftext and are keyed by the PDF's path,
+modification time and size (plus the extraction backend), so editing or
+replacing a PDF invalidates its entry automatically.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+
+from utils.pdf import BACKEND, iter_pages, read_page
+
+CACHE_DIR = Path.home() / ".cache" / "pdftext"
+
+
+def _cache_key(pdf_path: str | Path) -> str:
+    """Return a key that changes whenever the PDF file changes."""
+    path = Path(pdf_path).resolve()
+    st = os.stat(path)
+    raw = f"{path}:{st.st_mtime_ns}:{st.st_size}:{BACKEND}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _load(cache_path: Path) -> str | None:
+    """Return the cached text, or None when there is no usable entry."""
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _store(cache_path: Path, text: str) -> None:
+    """Write a cache entry atomically; failures only cost a future re-read."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def iter_pages_cached(
+    pdf_path: str | Path, skip_errors: bool = False, max_workers: int | None = None
+) -> Iterator[str]:
+    """Like utils.pdf.iter_pages, but served from the cache when possible.
+
+    On a miss the PDF is memory-mapped, pages are yielded as they are
+    extracted, and the cache entry is written once every page has been read.
+    With skip_errors an unreadable page is stored as "", so those entries
+    are kept apart and never served to a strict caller.
+    """
+    suffix = "-skip" if skip_errors else ""
+    cache_path = CACHE_DIR / f"{_cache_key(pdf_path)}{suffix}.json"
+    cached = _load(cache_path)
+    if cached is not None:
+        try:
+            yield from json.loads(cached)
+            return
+        except json.JSONDecodeError:
+            pass
+
+    pages: list[str] = []
+    with open(pdf_path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as pdf_data:
+        for page_text in iter_pages(pdf_data, skip_errors, max_workers):
+            pages.append(page_text)
+            yield page_text
+    _store(cache_path, json.dumps(pages, ensure_ascii=False))
+
+
+def read_pdf_cached(
+    pdf_path: str | Path, skip_errors: bool = False, max_workers: int | None = None
+) -> str:
+    """Like utils.pdf.read_pdf, but served from the cache when possible."""
+    return "\n".join(iter_pages_cached(pdf_path, skip_errors, max_workers))
+
+
+def read_page_cached(pdf_path: str | Path, page_index: int) -> str:
+    """Like utils.pdf.read_page, but served from the cache when possible."""
+    cache_path = CACHE_DIR / f"{_cache_key(pdf_path)}-p{page_index}.txt"
+    text = _load(cache_path)
+    if text is None:
+        text = read_page(pdf_path, page_index)
+        _store(cache_path, text)
+    return text
@@ -0,0 +1,93 @@
+"""Compiled-regex cache shared by the Projects scripts."""
+
+from functools import lru_cache
+import re
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Flags RE2 understands, expressed as inline flag letters.
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+_RE2_SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+# RE2's \d, \s and \w are ASCII-only; these match what re uses for str patterns.
+_UNICODE_CLASSES = {
+    "d": r"\p{Nd}",
+    "s": r"\t-\r\x{1c}-\x{20}\x{85}\p{Z}",
+    "w": r"\p{L}\p{N}_",
+}
+
+
+def _unicode_classes(pattern: str) -> str | None:
+    """Spell out \\d, \\s and \\w (and negations) as Unicode classes for RE2.
+
+    Returns None when a negated class sits inside brackets, which RE2
+    cannot express without the ASCII shorthand.
+    """
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            body = _UNICODE_CLASSES.get(escaped.lower())
+            if body is None:
+                out.append(pattern[i:i + 2])
+            elif in_class:
+                if escaped.isupper():
+                    return None
+                out.append(body)
+            else:
+                out.append(f"[^{body}]" if escaped.isupper() else f"[{body}]")
+            i += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+            out.append(char)
+            # A leading ] (after an optional ^) is a literal, not the end.
+            if pattern.startswith("^", i + 1):
+                out.append("^")
+                i += 1
+            if pattern.startswith("]", i + 1):
+                out.append("]")
+                i += 1
+        elif char == "]" and in_class:
+            in_class = False
+            out.append(char)
+        else:
+            out.append(char)
+        i += 1
+    return "".join(out)
+
+
+@lru_cache(maxsize=64)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex once per (pattern, flags) and reuse it afterwards."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=64)
+def compile_linear(pattern: str, flags: int = 0):
+    """Compile a regex with RE2 when available, else with the re module.
+
+    RE2 matches in linear time without backtracking, so large or malformed
+    input cannot blow up. The returned object supports the same search,
+    finditer and match-group calls as re.Pattern. \\d, \\s and \\w are
+    rewritten to Unicode classes so they match what re matches (e.g. a
+    non-breaking space). Patterns or flags RE2 rejects (backreferences,
+    lookaround, ...) fall back to compile_pattern.
+    """
+    if re2 is not None and not flags & ~_RE2_SUPPORTED_FLAGS:
+        translated = _unicode_classes(pattern)
+        if translated is not None:
+            inline = "".join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+            options = re2.Options()
+            options.log_errors = False
+            try:
+                return re2.compile(f"(?{inline}){translated}" if inline else translated, options)
+            except re2.error:
+                pass
+    return compile_pattern(pattern, flags)